@@ -26,28 +26,9 @@
 
 """Serialization and deserialization tools."""
 
-# 'Sphinx' will complain a lot if 'MiniCLEB' isn't installed on the system
-# (virtualenv's don't count, unfortunately), so we create a dummy library
-# instead to assuage its wrath.
-try:
-	import MiniCLEB as LEB
-except Exception as e:
-	class DepNotFoundException(Exception):
-		"Raised when the a dependency hasn't been found for import (it's probably not installed)."
-		
-		def __init__(self, dep, *args):
-			super().__init__("Dependency '" + str(dep) + "' not found (is it in installed in your virtualenv)?")
-	
-	def DocOnly(depname):
-		class wrapper:
-			"""This class should only ever be used by 'Sphinx' internally."""
-			
-			def __getattribute__(self, name):
-				raise DepNotFoundException(depname)
-		
-		return wrapper()
-	
-	LEB = DocOnly("MiniCLEB")
+import itertools
+import struct
+import sys
 
 __all__ = [
 	### Backend Interface
@@ -55,6 +36,8 @@ __all__ = [
 	"strToBytes",
 	"bytesToStr",
 	"ObeseMessageException",
+	"intToVLQ",
+	"VLQToInt",
 	"pascalify",
 	"depascalify",
 	"peel",
@@ -95,13 +78,16 @@ __all__ = [
 
 def strToBytes(s):
 	"""Converts a string into its blob equivalent."""
-	return bytes(str(s), "utf-8")
+	if type(s) is str:
+		return s.encode("utf-8")
+	else: # Anything else is converted to a string first
+		return str(s).encode("utf-8")
 
 def bytesToStr(byteobj):
 	"""Converts a blob into its string equivalent."""
-	return str(bytes(byteobj), "utf-8")
+	return str(byteobj, "utf-8") # Decodes any bytes-like object (such as a 'memoryview') without copying it first
 
-# Wrappers for 'MiniCLEB'
+# VLQ (LEB128) handling
 
 class ObeseMessageException(Exception):
 	"Raised by 'depascalify' when the message is too large to put into RAM (or is malformed as such)."
@@ -109,30 +95,107 @@ class ObeseMessageException(Exception):
 	def __init__(self, *args):
 		super().__init__("The message was too large to put into RAM (or is malformed as such).")
 
+def _encodeVLQ(n):
+	"""Encode a non-negative integer as a VLQ (LEB128), without looking it up in '_smallVLQs'."""
+	
+	# Spell out the encodings of up to 4 bytes (every length below 256 MiB)
+	if n < 0x80:
+		return bytes((n,))
+	if n < 0x4000:
+		return bytes(((n & 0x7F) | 0x80, n >> 7))
+	if n < 0x200000:
+		return bytes(((n & 0x7F) | 0x80, ((n >> 7) & 0x7F) | 0x80, n >> 14))
+	if n < 0x10000000:
+		return bytes(((n & 0x7F) | 0x80, ((n >> 7) & 0x7F) | 0x80, ((n >> 14) & 0x7F) | 0x80, n >> 21))
+	
+	# The number of bytes needed is known up front, so fill them in directly
+	# instead of growing the result one byte at a time.
+	nbytes = (n.bit_length() + 6) // 7
+	blob = bytearray(nbytes)
+	for i in range(nbytes - 1):
+		blob[i] = (n & 0x7F) | 0x80
+		n >>= 7
+	blob[-1] = n
+	return bytes(blob)
+
+# Most blobs are short, so the encodings of their lengths are looked up here
+# rather than computed each time.
+_smallVLQs = tuple(map(_encodeVLQ, range(1024)))
+
+def intToVLQ(n):
+	"""Encode a non-negative integer as a VLQ (LEB128)."""
+	if n < 1024:
+		return _smallVLQs[n]
+	else:
+		return _encodeVLQ(n)
+
+def VLQToInt(blob, off = 0):
+	"""Decode the VLQ (LEB128) found at offset 'off' in a blob, and return its value along with the offset of whatever follows it."""
+	
+	# Most VLQs (type names, short strings, small numbers) fit in a single byte
+	try:
+		byte = blob[off]
+	except IndexError:
+		raise ObeseMessageException()
+	if byte < 0x80:
+		return [byte, off + 1]
+	
+	# Look at up to 8 bytes at once: the lowest byte with a clear continuation
+	# bit is the last byte of the VLQ, so a single bit-scan finds its length.
+	chunk = blob[off : off + 8]
+	word = int.from_bytes(chunk, "little")
+	stop = ~word & 0x8080808080808080
+	end = (stop & -stop).bit_length() # Number of bits spanned by the VLQ
+	if 0 < end <= 8 * len(chunk):
+		# Pack the 7-bit groups together, doubling the width of each lane at
+		# every step.
+		data = word & ((1 << end) - 1) & 0x7F7F7F7F7F7F7F7F
+		data = (data & 0x007F007F007F007F) | ((data & 0x7F007F007F007F00) >> 1)
+		data = (data & 0x00003FFF00003FFF) | ((data & 0x3FFF00003FFF0000) >> 2)
+		data = (data & 0x000000000FFFFFFF) | ((data & 0x0FFFFFFF00000000) >> 4)
+		return [data, off + end // 8]
+	
+	# The VLQ is longer than 8 bytes (or is truncated), so fall back to reading
+	# it one byte at a time.
+	value = 0
+	shift = 0
+	length = len(blob)
+	while off < length:
+		byte = blob[off]
+		off += 1
+		value |= (byte & 0x7F) << shift
+		if byte < 0x80:
+			return [value, off]
+		shift += 7
+	raise ObeseMessageException()
+
 def pascalify(blob):
 	"""Concatenate the length of a blob with the object itself, and return the result."""
-	return LEB.fromInt(len(blob)) + blob
+	length = len(blob)
+	return intToVLQ(length) + blob
 
 def depascalify(blob):
 	"""Return the length of a blob along with EVERYTHING following said length field."""
-	[leb, blob] = LEB.extract(blob)
-	if not LEB.valid(leb):
+	[length, off] = VLQToInt(blob)
+	if sys.maxsize < length:
 		raise ObeseMessageException()
-	return [LEB.toInt(leb), blob]
+	return [length, blob[off : ]]
 
 def peel(blob):
 	"""Deconcatenate and depascalify a blob, and return it along with EVERYTHING that's left over."""
-	[blength, blob] = depascalify(blob)
+	[blength, off] = VLQToInt(blob)
+	if sys.maxsize < blength:
+		raise ObeseMessageException()
 	return [
-		blob[ : blength], # What we expect to receive given 'blength'
-		blob[blength : ], # What we didn't expect to receive
+		blob[off : off + blength], # What we expect to receive given 'blength'
+		blob[off + blength : ], # What we didn't expect to receive
 	]
 
 ### Serializers
 
 def _bytes_ser(x):
 	"""Serialize a blob."""
-	return bytes(x)
+	return x if type(x) is bytes else bytes(x) # 'bytes' are immutable, so there's no need to copy them
 
 def _str_ser(x):
 	"""Serialize a string."""
@@ -144,22 +207,121 @@ def _bool_ser(x):
 
 def _int_ser(x):
 	"""Serialize an integer."""
-	return _bool_ser(0 <= x) + LEB.fromInt(abs(x))
+	if 0 <= x:
+		return b"\xFF" + intToVLQ(x)
+	else:
+		return b"\x00" + intToVLQ(-x)
+
+# Serializers whose output (along with its length field) is cheap to produce
+# directly, so that 'Ser' doesn't need to measure it.
+
+def _bool_frame(x):
+	"""Serialize a boolean, and prepend the length of the result."""
+	return b"\x01\xFF" if x else b"\x01\x00"
+
+def _int_frame(x):
+	"""Serialize an integer, and prepend the length of the result."""
+	if 0 <= x < 1024:
+		return _smallInts[x]
+	else:
+		return pascalify(_int_ser(x))
+
+_smallInts = tuple(map(pascalify, map(_int_ser, range(1024))))
+
+# Floats and complexes are written as big-endian IEEE 754 doubles after a zero
+# byte, which tells them apart from the hex strings that they used to be.
+_float64 = struct.Struct(">xd")
+_complex128 = struct.Struct(">xdd")
+_framedFloat64 = struct.Struct(">Bxd") # The same, but with a (one byte) length field in front
+_framedComplex128 = struct.Struct(">Bxdd")
 
 def _float_ser(x):
 	"""Serialize a float."""
-	return strToBytes(x.hex())
+	return _float64.pack(x)
 
 def _complex_ser(x):
 	"Serialize a complex."
-	return _float_ser(x.real) + b" " + _float_ser(x.imag)
+	return _complex128.pack(x.real, x.imag)
+
+def _float_frame(x):
+	"""Serialize a float, and prepend the length of the result."""
+	return _framedFloat64.pack(_float64.size, x)
+
+def _complex_frame(x):
+	"""Serialize a complex, and prepend the length of the result."""
+	return _framedComplex128.pack(_complex128.size, x.real, x.imag)
+
+def _elements_ser(x):
+	"""Serialize each element of an iterable, and concatenate the pascalified results."""
+	parts = [] # Joined only once at the end, so nothing gets copied twice
+	for y in x:
+		body = Ser(y)
+		length = len(body)
+		parts.append(intToVLQ(length))
+		parts.append(body)
+	return b"".join(parts)
+
+# Struct codes that lists of ints or floats can be packed with, mapped to the
+# sizes of their items. Ints use the narrowest code that can hold all of them.
+_packedSizes = {
+	"b":	1,
+	"h":	2,
+	"i":	4,
+	"q":	8,
+	"d":	8,
+}
+
+_intCodes = [
+	["b",	-0x80,			0x7F],
+	["h",	-0x8000,		0x7FFF],
+	["i",	-0x80000000,		0x7FFFFFFF],
+	["q",	-0x8000000000000000,	0x7FFFFFFFFFFFFFFF],
+]
+
+def _packed_ser(x, serializer):
+	"""Serialize a list of ints or floats as an array packed by 'struct', or return 'None' if it can't be."""
+	if serializer is _float_ser:
+		code = "d"
+	elif serializer is _int_ser:
+		[low, high] = [min(x), max(x)]
+		for [code, least, most] in _intCodes:
+			if least <= low and high <= most:
+				break
+		else:
+			return None
+	else:
+		return None
+	
+	# Two zero bytes mark this layout, since no type name is empty (see '_homogeneous_ser')
+	return b"\x00\x00" + strToBytes(code) + struct.pack(">" + str(len(x)) + code, *x)
+
+def _homogeneous_ser(x, name, serializer):
+	"""Serialize a list whose elements all have the same type, naming that type only once."""
+	packed = _packed_ser(x, serializer)
+	if packed is not None:
+		return packed
+	
+	parts = [b"\x00", pascalify(strToBytes(name))] # The zero byte marks this layout (see '_dict_ser')
+	framer = _framers.get(serializer)
+	if framer is not None:
+		parts.extend(map(framer, x))
+	else:
+		for y in x:
+			body = serializer(y)
+			length = len(body)
+			parts.append(intToVLQ(length))
+			parts.append(body)
+	return b"".join(parts)
 
 def _list_ser(x):
 	"""Serialize a list recursively."""
-	blob = b""
-	for y in x:
-		blob += pascalify(Ser(y))
-	return blob
+	if isinstance(x, (list, tuple, set, frozenset)) and 1 < len(x):
+		types = set(map(type, x))
+		if len(types) == 1:
+			entry = serers.get(types.pop())
+			if entry is not None:
+				return _homogeneous_ser(x, *entry)
+	return _elements_ser(x)
 
 def _tuple_ser(x):
 	"""Serialize a tuple recursively."""
@@ -175,13 +337,16 @@ def _frozenset_ser(x):
 
 def _dict_ser(x):
 	"""Serialize a dict recursively."""
-	return _list_ser(map(_list_ser, x.items()))
+	# The leading zero byte marks that the keys and values are interleaved in a
+	# single list (no list body can start with one, since no element's
+	# serialization is empty).
+	return b"\x00" + _elements_ser(itertools.chain.from_iterable(x.items()))
 
 ### Deserializers
 
 def _bytes_des(blob):
 	"""Deserialize into a blob."""
-	return blob
+	return bytes(blob)
 
 def _str_des(blob):
 	"""Deserialize into a string."""
@@ -189,34 +354,73 @@ def _str_des(blob):
 
 def _bool_des(blob):
 	"""Deserialize into a boolean."""
-	return False if blob == b"\x00" else True
+	return blob != b"\x00"
 
 def _int_des(blob):
 	"""Deserialize into an integer."""
-	pospart = blob[1:]
+	pospart = VLQToInt(blob, 1)[0]
 	if _bool_des(blob[0:1]):
-		return LEB.toInt(pospart)
+		return pospart
 	else:
-		return -LEB.toInt(pospart)
+		return -pospart
 
 def _float_des(blob):
 	"""Deserialize into a float."""
-	return float.fromhex(bytesToStr(blob))
+	if blob[:1] == b"\x00":
+		return _float64.unpack(blob)[0]
+	else: # Written as a hex string
+		return float.fromhex(bytesToStr(blob))
 
 def _complex_des(bobj):
 	"Deserialize into a complex."
-	delim = bobj.index(b" ")
-	return complex(
-		_float_des(bobj[ : delim]),
-		_float_des(bobj[delim + 1 : ])
-	)
+	if bobj[:1] == b"\x00":
+		return complex(*_complex128.unpack(bobj))
+	else: # Written as two hex strings with a space between them
+		delim = bytes(bobj).index(b" ")
+		return complex(
+			_float_des(bobj[ : delim]),
+			_float_des(bobj[delim + 1 : ])
+		)
+
+def _undeserializable(blob):
+	"""Return the exception that is raised for blobs that can't be deserialized."""
+	return Exception("Error: object '" + str(bytes(blob)) + "' couldn't be deserialized...")
 
 def _list_des(blob):
 	"""Deserialize into a list (recursively)."""
+	blob = memoryview(blob) # Slicing a 'memoryview' doesn't copy anything
 	x = []
-	while blob != b"":
-		[y, blob] = peel(blob)
-		x.append(Des(y))
+	off = 0
+	end = len(blob)
+	
+	if 1 < end and blob[0] == 0 and blob[1] == 0:
+		# The elements were packed by 'struct'
+		code = chr(blob[2]) if 2 < end else None
+		size = _packedSizes.get(code)
+		if size is None or (end - 3) % size != 0:
+			raise _undeserializable(blob)
+		return list(struct.unpack(">" + str((end - 3) // size) + code, blob[3 : ]))
+	
+	if 0 < end and blob[0] == 0:
+		# The elements all have the same type, which is named only once
+		try:
+			[length, off] = VLQToInt(blob, 1)
+			deserializer = desers[bytesToStr(blob[off : off + length])]
+		except Exception:
+			raise _undeserializable(blob)
+		off += length
+		if deserializer not in _viewers:
+			blob = bytes(blob) # Only copied once for all of the elements
+		while off < end:
+			[length, off] = VLQToInt(blob, off)
+			x.append(deserializer(blob[off : off + length]))
+			off += length
+		return x
+	
+	while off < end:
+		[length, off] = VLQToInt(blob, off)
+		x.append(Des(blob[off : off + length]))
+		off += length
 	return x
 
 def _tuple_des(blob):
@@ -231,13 +435,22 @@ def _frozenset_des(blob):
 	"""Deserialize into a frozenset."""
 	return frozenset(_list_des(blob))
 
+def _pairsToDict(x):
+	"""Build a dict out of a list of alternating keys and values."""
+	x = iter(x)
+	return dict(zip(x, x)) # Pairs each key with its value without slicing 'x'
+
 def _dict_des(blob):
 	"""Deserialize into a dict."""
-	return dict(map(_list_des, _list_des(blob)))
+	if blob[ : 1] == b"\x00":
+		return _pairsToDict(_list_des(blob[1 : ]))
+	else:
+		return dict(map(_list_des, _list_des(blob))) # Each (key, value) pair was serialized as its own list before
 
 ### Frontend Interface
 
-#: Full list of serializers available to 'Ser'.
+#: Full list of serializers available to 'Ser'. Tuples, sets, and frozensets
+#: are serialized the same way as lists, so they go straight to '_list_ser'.
 serers = {
 	bytes:		["bytes",	_bytes_ser],
 	str:		["str",		_str_ser],
@@ -246,9 +459,9 @@ serers = {
 	float:		["float",	_float_ser],
 	complex:	["complex",	_complex_ser],
 	list:		["list",	_list_ser],
-	tuple:		["tuple",	_tuple_ser],
-	set:		["set",		_set_ser],
-	frozenset:	["frozenset",	_frozenset_ser],
+	tuple:		["tuple",	_list_ser],
+	set:		["set",		_list_ser],
+	frozenset:	["frozenset",	_list_ser],
 	dict:		["dict",	_dict_ser],
 }
 
@@ -267,6 +480,49 @@ desers = {
 	"dict":		_dict_des,
 }
 
+# Type names are encoded and pascalified once, and then reused by 'Ser'. This is
+# keyed by name rather than by type so that changes to 'serers' take effect.
+_headers = {}
+
+# Deserializers of containers, mapped to the functions that build the
+# containers out of lists of their elements. 'Des' takes care of these
+# containers itself rather than recursing through their deserializers. The
+# second builder is for bodies that start with a zero byte, whose elements
+# follow that byte (without one, 'Des' leaves such bodies to the deserializer).
+_builders = {
+	_list_des:	[list,					None],
+	_tuple_des:	[tuple,					None],
+	_set_des:	[set,					None],
+	_frozenset_des:	[frozenset,				None],
+	_dict_des:	[lambda x: dict(map(_list_des, x)),	_pairsToDict],
+}
+
+# Deserializers that can be handed a 'memoryview' of their blob. Any others
+# (such as those added to 'desers' by users) are handed 'bytes' instead.
+_viewers = {
+	_bytes_des,
+	_str_des,
+	_bool_des,
+	_int_des,
+	_float_des,
+	_complex_des,
+	_list_des,
+	_tuple_des,
+	_set_des,
+	_frozenset_des,
+	_dict_des,
+}
+
+# Serializers, mapped to functions that produce their output already
+# pascalified. These are looked up by serializer rather than by type, so that
+# changes to 'serers' take effect.
+_framers = {
+	_bool_ser:	_bool_frame,
+	_int_ser:	_int_frame,
+	_float_ser:	_float_frame,
+	_complex_ser:	_complex_frame,
+}
+
 def Ser(x):
 	"""Serializes a python object into a blob."""
 	
@@ -275,18 +531,100 @@ def Ser(x):
 	except Exception:
 		raise Exception("Error: object '" + str(x) + "' couldn't be serialized...")
 	
-	return pascalify(strToBytes(name)) + pascalify(serializer(x))
+	try:
+		header = _headers[name]
+	except KeyError:
+		header = _headers[name] = pascalify(strToBytes(name))
+	
+	framer = _framers.get(serializer)
+	if framer is not None:
+		return header + framer(x)
+	
+	body = serializer(x)
+	length = len(body)
+	return b"".join((header, intToVLQ(length), body)) # One copy of 'body' rather than two
+
+# Encoded type names that 'Des' has already decoded, mapped to their decodings.
+# Only names found in 'desers' are kept, so this can't grow without bound.
+_typenames = {}
 
 def Des(blob):
 	"""Deserializes a blob into a python object."""
 	
-	try:
-		[name, blob] = peel(blob)
-		deserializer = desers[bytesToStr(name)]
-	except Exception:
-		raise Exception("Error: object '" + str(blob) + "' couldn't be deserialized...")
+	blob = memoryview(blob)
+	if not blob.readonly:
+		blob = memoryview(bytes(blob)) # Writable views can't be used as dictionary keys
 	
-	return deserializer(peel(blob)[0])
+	# Containers are deserialized in this loop rather than through recursive
+	# calls, so each one that's still being filled in gets a frame on this
+	# stack: [builder, elements, end of its body, end of the whole container].
+	# The innermost frame's elements and body end are also kept in locals.
+	stack = []
+	off = 0
+	end = len(blob)
+	while True:
+		# Read the header of the object in 'blob[off : end]'
+		try:
+			[length, bodyoff] = VLQToInt(blob, off)
+			name = blob[bodyoff : bodyoff + length]
+			try:
+				deserializer = desers[_typenames[name]]
+			except KeyError:
+				typename = bytesToStr(name)
+				deserializer = desers[typename]
+				_typenames[bytes(name)] = typename
+			[length, bodyoff] = VLQToInt(blob, bodyoff + length)
+			if end < bodyoff: # The header ran into whatever follows this object
+				raise ObeseMessageException()
+		except Exception:
+			raise _undeserializable(blob[off : end])
+		bodyend = bodyoff + length
+		if end < bodyend:
+			bodyend = end
+		
+		builder = _builders.get(deserializer)
+		if builder is not None:
+			if bodyoff < bodyend and blob[bodyoff] == 0:
+				builder = builder[1]
+				if builder is not None:
+					bodyoff += 1
+			else:
+				builder = builder[0]
+		
+		if builder is None:
+			value = blob[bodyoff : bodyend]
+			value = deserializer(value if deserializer in _viewers else bytes(value))
+			if not stack:
+				return value
+			elements.append(value)
+			off = end
+		else:
+			elements = []
+			limit = bodyend
+			stack.append([builder, elements, limit, end])
+			off = bodyoff
+		
+		# Finish off every container that has no elements left
+		while limit <= off:
+			[builder, value, _, off] = stack.pop()
+			if builder is not list:
+				value = builder(value)
+			if not stack:
+				return value
+			[_, elements, limit, _] = stack[-1]
+			elements.append(value)
+		
+		# Move on to the next element of the innermost unfinished container
+		try:
+			[length, start] = VLQToInt(blob, off)
+			if limit < start:
+				raise ObeseMessageException()
+		except Exception:
+			raise _undeserializable(blob[off : limit])
+		off = start
+		end = off + length
+		if limit < end:
+			end = limit
 
 ### Unit Tests
 
@@ -306,10 +644,13 @@ class testLooperMixin(unittest.TestCase):
 				extraAssert()
 
 def __scopewrapper():
+	# 'MiniCLEB' is only needed here, as a reference for the encoding of VLQs
+	import MiniCLEB as LEB
+	
 	# Local declarations to make life easier
 	
-	obj5 = b"\xFF" + LEB.fromInt(5)
-	obj5 = LEB.fromInt(3) + b"int" + LEB.fromInt(len(obj5)) + obj5
+	body5 = b"\xFF" + LEB.fromInt(5)
+	obj5 = LEB.fromInt(3) + b"int" + LEB.fromInt(len(body5)) + body5
 	
 	objbee = LEB.fromInt(3) + b"str" + LEB.fromInt(3) + b"bee"
 	objbeeser = LEB.fromInt(len(objbee)) + objbee
@@ -319,8 +660,44 @@ def __scopewrapper():
 	objhi = LEB.fromInt(3) + b"str" + LEB.fromInt(2) + b"hi"
 	objhiser = LEB.fromInt(len(objhi)) + objhi
 	
+	objhihiser = b"\x00" + LEB.fromInt(3) + b"str" + (LEB.fromInt(2) + b"hi") * 2
+	
 	# Testing classes
 	
+	class testBackend(testLooperMixin):
+		def test_strToBytes(self):
+			args = ["", "hi", "\u00e9", 5, 1.5, None]
+			expecteds = [b"", b"hi", b"\xc3\xa9", b"5", b"1.5", b"None"]
+			self.loopTests(args, expecteds, strToBytes)
+		
+		def test_intToVLQ(self):
+			args = [0, 1, 127, 128, 300, 2 ** 14 - 1, 2 ** 14, 2 ** 21 - 1, 2 ** 21, 2 ** 28 - 1, 2 ** 28, 2 ** 56, 2 ** 63 - 1]
+			expecteds = list(map(LEB.fromInt, args))
+			self.loopTests(args, expecteds, intToVLQ)
+		
+		def test_VLQToInt(self):
+			values = [0, 1, 127, 128, 300, 2 ** 14, 2 ** 49 - 1, 2 ** 56 - 1, 2 ** 56, 2 ** 63 - 1]
+			
+			args = [
+				b"\xAA" + LEB.fromInt(n) + b"\x80\x01"
+				for n
+				in values
+			]
+			
+			expecteds = [
+				[n, 1 + len(LEB.fromInt(n))]
+				for n
+				in values
+			]
+			
+			self.loopTests(args, expecteds, lambda blob: VLQToInt(blob, 1))
+		
+		def test_VLQToInt_truncated(self):
+			for blob in [b"", b"\x80", b"\xFF" * 7, b"\xFF" * 12]:
+				with self.subTest(blob = blob):
+					with self.assertRaises(ObeseMessageException):
+						VLQToInt(blob)
+	
 	class testSerializers(testLooperMixin):
 		def test_bytes(self):
 			arg = b"lwiherkjtghjfd"
@@ -391,6 +768,36 @@ def __scopewrapper():
 			
 			self.loopTests(args, expecteds, _list_ser)
 		
+		def test_list_homogeneous(self):
+			args = [
+				[5, 5, 5],
+				[5, -300],
+				[1.5, -2.0],
+				[5, 2 ** 70],
+				["bee", "hi"],
+				[["bee"], ["hi", "hi"]],
+			]
+			
+			expecteds = [
+				b"\x00\x00b\x05\x05\x05",
+				b"\x00\x00h\x00\x05\xFE\xD4",
+				b"\x00\x00d" + struct.pack(">dd", 1.5, -2.0),
+				
+				b"\x00" + LEB.fromInt(3) + b"int" + \
+				LEB.fromInt(len(body5)) + body5 + \
+				LEB.fromInt(len(_int_ser(2 ** 70))) + _int_ser(2 ** 70),
+				
+				b"\x00" + LEB.fromInt(3) + b"str" + \
+				LEB.fromInt(3) + b"bee" + \
+				LEB.fromInt(2) + b"hi",
+				
+				b"\x00" + LEB.fromInt(4) + b"list" + \
+				LEB.fromInt(len(objbeeser)) + objbeeser + \
+				LEB.fromInt(len(objhihiser)) + objhihiser,
+			]
+			
+			self.loopTests(args, expecteds, _list_ser)
+		
 		# def test_tuple(self): # Since '_tuple_ser' is just a call to '_list_ser', it is redundant
 		
 		# def test_set(self): # Since '_set_ser' is just a call to '_list_ser', it is redundant
@@ -411,11 +818,56 @@ def __scopewrapper():
 		
 		# def test_int(self): # Too simple to write a test for as of now
 		
-		# def test_bool(self): # Too simple to write a test for as of now
+		def test_bool(self):
+			args = [
+				b"\x00",
+				b"\xFF",
+				memoryview(b"\x00"),
+				memoryview(b"\xFF"),
+			]
+			
+			expecteds = [
+				False,
+				True,
+				False,
+				True,
+			]
+			
+			self.loopTests(args, expecteds, _bool_des)
 		
-		# def test_float(self): # Too simple to write a test for as of now
+		def test_float(self):
+			args = [
+				_float_ser(1.5),
+				_float_ser(-0.0),
+				_float_ser(float("inf")),
+				b"0x1.8000000000000p+0",
+				b"-0x0.0p+0",
+				b"inf",
+			]
+			
+			expecteds = [
+				1.5,
+				-0.0,
+				float("inf"),
+				1.5,
+				-0.0,
+				float("inf"),
+			]
+			
+			self.loopTests(args, expecteds, _float_des)
 		
-		# def test_complex(self): # Too simple to write a test for as of now
+		def test_complex(self):
+			args = [
+				_complex_ser(1.5 - 2j),
+				b"0x1.8000000000000p+0 -0x1.0000000000000p+1",
+			]
+			
+			expecteds = [
+				1.5 - 2j,
+				1.5 - 2j,
+			]
+			
+			self.loopTests(args, expecteds, _complex_des)
 		
 		@patch(__name__ + ".Des")
 		def test_list(self, notDes):
@@ -476,17 +928,103 @@ def __scopewrapper():
 			
 			self.loopTests(args, expecteds, _list_des)
 		
+		def test_list_homogeneous(self):
+			args = [
+				b"\x00" + LEB.fromInt(3) + b"int" + (LEB.fromInt(len(body5)) + body5) * 3,
+				b"\x00\x00b\x05\x05\x05",
+				b"\x00\x00h\x00\x05\xFE\xD4",
+				b"\x00\x00d" + struct.pack(">dd", 1.5, -2.0),
+				
+				b"\x00" + LEB.fromInt(3) + b"str" + \
+				LEB.fromInt(3) + b"bee" + \
+				LEB.fromInt(2) + b"hi",
+				
+				b"\x00" + LEB.fromInt(4) + b"list" + \
+				LEB.fromInt(len(objbeeser)) + objbeeser + \
+				LEB.fromInt(len(objhihiser)) + objhihiser,
+			]
+			
+			expecteds = [
+				[5, 5, 5],
+				[5, 5, 5],
+				[5, -300],
+				[1.5, -2.0],
+				["bee", "hi"],
+				[["bee"], ["hi", "hi"]],
+			]
+			
+			self.loopTests(args, expecteds, _list_des)
+		
+		def test_list_malformed(self):
+			args = [
+				b"\x00\x00", # Packed, but with no struct code
+				b"\x00\x00z\x05",
+				b"\x00\x00h\x00\x05\x00",
+				b"\x00" + LEB.fromInt(4) + b"nope" + LEB.fromInt(len(body5)) + body5,
+				b"\x00" + LEB.fromInt(2) + b"\xFF\xFE",
+				b"\x00\x85",
+			]
+			
+			for [i, arg] in enumerate(args):
+				with self.subTest(i = i):
+					self.assertRaisesRegex(Exception, "couldn't be deserialized", _list_des, arg)
+					self.assertRaisesRegex(Exception, "couldn't be deserialized", Des, pascalify(b"list") + pascalify(arg))
+		
+		def test_nested_malformed(self):
+			one = pascalify(Ser(1))
+			args = [
+				pascalify(b"list") + pascalify(b"\x80"), # Truncated length of the only element
+				pascalify(b"list") + pascalify(one + b"\x85"), # Truncated length of a sibling
+				pascalify(b"list") + pascalify(pascalify(b"list") + pascalify(one + b"\x85") + one), # The same, within a nested list
+				pascalify(b"list") + pascalify(b"\x04" + Ser(1) + one), # The first element is too short for its own header
+			]
+			
+			for [i, arg] in enumerate(args):
+				with self.subTest(i = i):
+					self.assertRaisesRegex(Exception, "couldn't be deserialized", Des, arg)
+		
 		# def test_tuple(self): # Since '_tuple_des' is just a call to '_list_des', it is redundant
 		
 		# def test_set(self): # Since '_set_des' is just a call to '_list_des', it is redundant
 		
 		# def test_frozenset(self): # Since '_frozenset_des' is just a call to '_list_des', it is redundant
 		
-		# @patch(__name__ + "._list_des")
-		# def test_dict(self, notListDes): # I could test this, but it's too simple for me to bother
+		def test_dict(self):
+			x = {"a": 1, 2: (b"b",), (3,): {"c": 4.5}}
+			
+			args = [
+				_dict_ser({}),
+				_dict_ser(x),
+				_elements_ser(map(_elements_ser, {}.items())), # How dicts were serialized before their pairs were flattened
+				_elements_ser(map(_elements_ser, x.items())),
+			]
+			
+			expecteds = [
+				{},
+				x,
+				{},
+				x,
+			]
+			
+			self.loopTests(args, expecteds, _dict_des)
+			self.loopTests(args, expecteds, lambda blob: Des(pascalify(b"dict") + pascalify(blob)))
+		
+		def test_custom(self):
+			class POINT(tuple):
+				pass
+			
+			serers[POINT] = ["POINT", lambda x: strToBytes(",".join(map(str, x)))]
+			desers["POINT"] = lambda blob: POINT(map(int, blob.decode("utf-8").split(","))) # Needs 'bytes' rather than a 'memoryview'
+			try:
+				for x in [POINT([1, 2]), [POINT([3, 4]), 5], [POINT([5, 6]), POINT([7, 8])]]:
+					with self.subTest(x = x):
+						self.assertEqual(Des(Ser(x)), x)
+			finally:
+				del serers[POINT]
+				del desers["POINT"]
 	
-	return [testSerializers, testDeserializers]
+	return [testBackend, testSerializers, testDeserializers]
 
 if __name__ == "__main__":
-	[testSerializers, testDeserializers] = __scopewrapper()
+	[testBackend, testSerializers, testDeserializers] = __scopewrapper()
 	unittest.main()
@@ -50,6 +50,7 @@ __all__ = [
 	### Frontend Interface
 	
 	"Ver",
+	"Compile",
 ]
 
 ### Notes
@@ -73,17 +74,26 @@ __all__ = [
 # since it preserves short-circuit operation of the 'any' and 'all' builtin
 # functions. This is because 'map' is effectively a generator function, while
 # list comprehensions must perform full initialization of the list first.
+# Functions are handed to 'map' directly (with 'itertools.repeat' supplying any
+# fixed arguments) rather than wrapped in lambdas, so that no extra python-level
+# call is made per element.
 
 ### Backend Interface
 
 class VERIFYABLE(abc.ABC):
 	"""Abstract class indicating that child classes have the method 'verify'."""
+	__slots__ = ("__weakref__",) # Specifications have no '__dict__' unless a subclass leaves out '__slots__'
+	
+	_verifyable = True # Inherited by every subclass, so that 'Ver' can recognize specifications without walking their class hierarchy
+	
 	@abc.abstractmethod
 	def verify(self, obj):
 		return True
 
 class OFLENGTH(VERIFYABLE, abc.ABC): # TODO: Add tests for this class
 	"""Abstract class that can be used to verify that an object has a certain length."""
+	__slots__ = () # 'minlength' and 'maxlength' are slotted by '_SLOTTED'
+	
 	def __init__(self, *args, minlength = None, maxlength = None, length = None, **kwargs):
 		self.minlength = length or minlength or 0
 		self.maxlength = length or maxlength or math.inf
@@ -100,102 +110,258 @@ class OFLENGTH(VERIFYABLE, abc.ABC): # TODO: Add tests for this class
 
 class CUSTOM(VERIFYABLE, abc.ABC):
 	"""Abstract class that can be used to verify that an object is of a specific type."""
+	__slots__ = () # 'tipo' is slotted by '_SLOTTED'
+	
 	def __init__(self, tipo, *args, **kwargs):
 		self.tipo = tipo
 		super().__init__(*args, **kwargs)
 	
 	@abc.abstractmethod
 	def verify(self, obj):
-		if type(obj) != self.tipo:
+		if type(obj) is not self.tipo:
 			return False
 		
 		return super().verify(obj)
 
 ### Pre-Made Specifications
 
-class SUM(VERIFYABLE):
+class _SLOTTED(VERIFYABLE):
+	"""Abstract class holding the slots of every pre-made specification. Two classes that each declare slots of their own can't be combined (as in 'class T(TUPLE, PRODUCT)'), so the pre-made specifications all share this one layout instead."""
+	__slots__ = (
+		"args", "types", "specs", "length", "plain",	# 'SUM' and 'PRODUCT'
+		"tipo", "minlength", "maxlength",		# 'CUSTOM' and 'OFLENGTH'
+		"subtipo", "subplain", "KVtipo",		# 'ITERABLE' and 'DICT'
+	)
+
+class SUM(_SLOTTED):
 	"""Class that checks that a given object is of ANY of the types given during initialization."""
+	__slots__ = ()
+	
 	def __init__(self, *args):
-		self.args = args
+		flat = []
+		for arg in args:
+			# 'SUM(SUM(a, b), c)' is the same as 'SUM(a, b, c)', but without the extra call to 'Ver'
+			for alternative in (arg.args if type(arg) is SUM else [arg]):
+				if type(alternative) is not type or alternative not in flat: # Plain classes only need checking once
+					flat.append(alternative)
+		
+		# Plain classes are cheaper to check than anything VERIFYABLE, so they're tried first
+		self.args = tuple(sorted(flat, key = lambda alternative: type(alternative) is not type)) # 'sorted' is stable
+		plain = sum(map(lambda alternative: type(alternative) is type, self.args))
+		self.types = self.args[ : plain]
+		self.specs = self.args[plain : ]
 	
 	def verify(self, obj):
-		return any(map(
-			lambda tipo: Ver(obj, tipo),
-			self.args
-		))
+		if isinstance(obj, self.types): # Checks every plain class in one call
+			return True
+		
+		if len(self.specs) < 2: # Nothing to gain from 'any' and 'map' here
+			return len(self.specs) == 1 and Ver(obj, self.specs[0])
+		
+		return any(map(Ver, itertools.repeat(obj), self.specs))
 
-class PRODUCT(VERIFYABLE):
+class PRODUCT(_SLOTTED):
 	"""Class that checks that a given iterable's elements have the SAME TYPE SIGNATURE as that given during initialization."""
+	__slots__ = ()
+	
 	def __init__(self, *args):
 		self.args = args
 		self.length = len(args)
+		self.plain = all(type(arg) is type for arg in args) # If so, 'Ver' would just call 'isinstance' on each element
 	
 	def verify(self, objs):
 		if len(objs) != self.length:
 			return False
 		
-		return all(map(
-			lambda obj, arg: Ver(obj, arg),
-			objs, self.args
-		))
+		if self.plain:
+			return all(map(isinstance, objs, self.args))
+		
+		return all(map(Ver, objs, self.args))
 
-class ITERABLE(CUSTOM, OFLENGTH):
+class ITERABLE(CUSTOM, OFLENGTH, _SLOTTED):
 	"""Class that checks that a given iterable's elements ALL belong to a type given during initialization."""
+	__slots__ = ()
+	
 	def __init__(self, tipo, subtipo, *args, **kwargs):
 		self.subtipo = subtipo
+		self.subplain = type(subtipo) is type # See 'PRODUCT.__init__'
 		super().__init__(tipo, *args, **kwargs)
 	
 	def verify(self, objs):
-		return super().verify(objs) and all(map(
-			lambda obj: Ver(obj, self.subtipo),
-			objs
-		))
+		if self.subplain:
+			return super().verify(objs) and all(map(isinstance, objs, itertools.repeat(self.subtipo)))
+		
+		return super().verify(objs) and all(map(Ver, objs, itertools.repeat(self.subtipo)))
 
 class LIST(ITERABLE):
 	"""Checks that the given iterable is a list containing elements of a type specified during initialization."""
+	__slots__ = ()
+	
 	def __init__(self, *args, **kwargs):
 		super().__init__(list, *args, **kwargs)
 
 class TUPLE(ITERABLE):
 	"""Checks that the given iterable is a tuple containing elements of a type specified during initialization."""
+	__slots__ = ()
+	
 	def __init__(self, *args, **kwargs):
 		super().__init__(tuple, *args, **kwargs)
 
 class SET(ITERABLE):
 	"""Checks that the given iterable is a set containing elements of a type specified during initialization."""
+	__slots__ = ()
+	
 	def __init__(self, *args, **kwargs):
 		super().__init__(set, *args, **kwargs)
 
 class FROZENSET(ITERABLE):
 	"""Checks that the given iterable is a frozenset containing elements of a type specified during initialization."""
+	__slots__ = ()
+	
 	def __init__(self, *args, **kwargs):
 		super().__init__(frozenset, *args, **kwargs)
 
-class DICT(CUSTOM, OFLENGTH):
-	"""Checks that each (key, value) pair within the given dictionary is of a type specified during initialization."""
+class DICT(CUSTOM, OFLENGTH, _SLOTTED):
+	"""Checks that each (key, value) pair (as a tuple) within the given dictionary is of a type specified during initialization."""
+	__slots__ = ()
+	
 	def __init__(self, KVtipo, *args, **kwargs):
 		self.KVtipo = KVtipo
 		super().__init__(dict, *args, **kwargs)
 	
 	def verify(self, objs):
-		return super().verify(objs) and all(itertools.starmap(
-			lambda k, v: self.KVtipo.verify([k, v]),
-			objs.items()
-		))
+		return super().verify(objs) and all(map(self.KVtipo.verify, objs.items()))
+
+### Compilation
+
+# 'Compile' turns a whole specification into one python expression, so that
+# checking an object doesn't dispatch on every part of the specification again.
+# Each of the functions below returns an expression that is true when the
+# object named by 'name' meets a specification. Anything the expression refers
+# to is stored in 'env' (the globals of the compiled function), and 'names'
+# supplies names for the variables of any loops in the expression.
+
+def _bind(obj, env):
+	"""Store an object in 'env', and return the name that it was stored under."""
+	name = "_" + str(len(env))
+	env[name] = obj
+	return name
+
+def _emit(spec, name, env, names):
+	"""Return an expression that checks an object the same way that 'Ver' would."""
+	tipo = type(spec)
+	if tipo is not type and (getattr(tipo, "_verifyable", False) or isinstance(spec, VERIFYABLE)):
+		return _emitVerify(spec, name, env, names)
+	else:
+		return "isinstance(" + name + ", " + _bind(spec, env) + ")"
+
+def _emitVerify(spec, name, env, names):
+	"""Return an expression that checks an object the same way that 'spec.verify' would."""
+	tipo = type(spec)
+	if all(map(_inlinable.__contains__, tipo.__mro__)):
+		return _emitters[tipo.verify](spec, name, env, names)
+	else: # Not built purely from our classes, so it has to be called
+		return _bind(spec, env) + ".verify(" + name + ")"
+
+def _emitLength(spec, name, env):
+	"""Return an expression that checks the length of an object the same way that 'OFLENGTH.verify' would (or 'None' if any length will do)."""
+	if spec.minlength == 0 and spec.maxlength == math.inf:
+		return None
+	else:
+		return _bind(spec.minlength, env) + " <= len(" + name + ") < " + _bind(spec.maxlength, env)
+
+def _emitSUM(spec, name, env, names):
+	"""Return an expression that checks an object the same way that 'SUM.verify' would."""
+	terms = [_emit(arg, name, env, names) for arg in spec.specs]
+	if spec.types:
+		terms.insert(0, "isinstance(" + name + ", " + _bind(spec.types, env) + ")")
+	
+	return "(" + " or ".join(terms) + ")" if terms else "False"
+
+def _emitPRODUCT(spec, name, env, names):
+	"""Return an expression that checks an object the same way that 'PRODUCT.verify' would."""
+	terms = [
+		_emit(arg, name + "[" + str(i) + "]", env, names)
+		for [i, arg]
+		in enumerate(spec.args)
+	]
+	
+	# Only lists and tuples are indexed. Anything else is iterated over by 'spec.verify' itself.
+	return "(len(" + name + ") == " + str(spec.length) + " and (" + \
+		" and ".join(terms or ["True"]) + \
+		" if type(" + name + ") in (tuple, list) else " + _bind(spec, env) + ".verify(" + name + ")))"
+
+def _emitITERABLE(spec, name, env, names):
+	"""Return an expression that checks an object the same way that 'ITERABLE.verify' would."""
+	terms = ["type(" + name + ") is " + _bind(spec.tipo, env)]
+	
+	length = _emitLength(spec, name, env)
+	if length is not None:
+		terms.append(length)
+	
+	if type(spec.subtipo) is type:
+		terms.append("all(map(isinstance, " + name + ", " + _bind(itertools.repeat(spec.subtipo), env) + "))")
+	else:
+		element = "_e" + str(next(names))
+		terms.append("all(" + _emit(spec.subtipo, element, env, names) + " for " + element + " in " + name + ")")
+	
+	return "(" + " and ".join(terms) + ")"
+
+def _emitDICT(spec, name, env, names):
+	"""Return an expression that checks an object the same way that 'DICT.verify' would."""
+	terms = ["type(" + name + ") is dict"]
+	
+	length = _emitLength(spec, name, env)
+	if length is not None:
+		terms.append(length)
+	
+	pair = "_e" + str(next(names))
+	terms.append("all(" + _emitVerify(spec.KVtipo, pair, env, names) + " for " + pair + " in " + name + ".items())")
+	
+	return "(" + " and ".join(terms) + ")"
+
+# Verification functions, mapped to functions that emit expressions doing the
+# same thing. These are looked up by 'verify' rather than by class, so that
+# 'LIST', 'TUPLE' and so on all share 'ITERABLE's entry.
+_emitters = {
+	SUM.verify:		_emitSUM,
+	PRODUCT.verify:		_emitPRODUCT,
+	ITERABLE.verify:	_emitITERABLE,
+	DICT.verify:		_emitDICT,
+}
+
+# Classes whose part in 'verify' the emitters above reproduce. Any other class in
+# a specification's MRO could take part through 'super', so it has to be called.
+_inlinable = {object, abc.ABC, VERIFYABLE, OFLENGTH, CUSTOM, _SLOTTED, SUM, PRODUCT, ITERABLE, LIST, TUPLE, SET, FROZENSET, DICT}
 
 ### Frontend Interface
 
 def Ver(obj, spec):
 	"""If the given type specification is of type VERIFYABLE, call the verification function of the given specification. Otherise, verify that the object is of the given type directly."""
-	if isinstance(spec, VERIFYABLE):
+	tipo = type(spec)
+	if tipo is type: # A plain class, which can't be VERIFYABLE
+		return isinstance(obj, spec)
+	elif getattr(tipo, "_verifyable", False):
+		return spec.verify(obj)
+	elif isinstance(spec, VERIFYABLE): # E.g. classes registered with 'VERIFYABLE.register'
 		return spec.verify(obj)
 	else:
 		return isinstance(obj, spec)
 
+def Compile(spec):
+	"""Return a function that verifies objects against the given type specification like 'Ver' would, but faster. The specification shouldn't be changed afterwards, since the function may not notice."""
+	env = {}
+	try:
+		return eval("lambda obj: " + _emit(spec, "obj", env, itertools.count()), env)
+	except (SyntaxError, RecursionError, MemoryError): # Too deeply nested for python's compiler
+		return lambda obj: Ver(obj, spec)
+
 ### Unit Tests
 
 import unittest
 from unittest.mock import call, patch, Mock
+import gc
+import weakref
 import itertools
 
 class setwiseChecker():
@@ -302,6 +468,72 @@ class testSpecifications(testLooperMixin, checkCallsMixin):
 		
 		self.loopTests(args, expecteds, lambda t: CONCRETE(**t[0]).verify(t[1]))
 	
+	def test_CUSTOM(self):
+		# 'CUSTOM' can be combined with any specification
+		class TPRODUCT(CUSTOM, PRODUCT):
+			def verify(self, objs): return super().verify(objs)
+		
+		class TSUM(CUSTOM, SUM):
+			def verify(self, obj): return super().verify(obj)
+		
+		args = [
+			[TPRODUCT(tuple, str, int),
+				("a", 1)],
+			[TPRODUCT(tuple, str, int),
+				["a", 1]],
+			[TPRODUCT(tuple, str, int),
+				("a", "b")],
+			[TSUM(int, int, str),
+				5],
+			[TSUM(int, int, str),
+				True],
+		]
+		
+		expecteds = [
+			True,
+			False,
+			False,
+			True,
+			False,
+		]
+		
+		self.loopTests(args, expecteds, lambda t: Ver(t[1], t[0]))
+	
+	def test_combined(self):
+		# Pre-made specifications can be combined with each other too
+		class TPRODUCT(TUPLE, PRODUCT): pass # A tuple of 'subtipo' with the signature of the remaining arguments
+		class LSUM(LIST, SUM): pass # A list of 'subtipo' that is also one of the remaining arguments
+		
+		args = [
+			[TPRODUCT(int, int, int),
+				(1, 2)],
+			[TPRODUCT(int, int, int),
+				[1, 2]],
+			[TPRODUCT(int, int, int),
+				(1, 2, 3)],
+			[TPRODUCT(int, object, object),
+				(1, "2")],
+			[LSUM(int, list),
+				[1, 2]],
+			[LSUM(int, list),
+				[1, "2"]],
+			[LSUM(int, tuple),
+				[1, 2]],
+		]
+		
+		expecteds = [
+			True,
+			False,
+			False,
+			False,
+			True,
+			False,
+			False,
+		]
+		
+		self.loopTests(args, expecteds, lambda t: Ver(t[1], t[0]))
+		self.loopTests(args, expecteds, lambda t: Compile(t[0])(t[1]))
+	
 	def test_SUM(self):
 		args = [
 			[[], 8],
@@ -309,6 +541,8 @@ class testSpecifications(testLooperMixin, checkCallsMixin):
 			[[int], "hi"],
 			[[str, float, int], "blegh"],
 			[[str, float, int], 38 + 5j],
+			[[SUM(str, int), float], 5],
+			[[SUM(str, SUM(int)), float], 38 + 5j],
 		]
 		
 		expecteds = [
@@ -317,19 +551,25 @@ class testSpecifications(testLooperMixin, checkCallsMixin):
 			False,
 			True,
 			False,
+			True,
+			False,
 		]
 		
 		self.loopTests(args, expecteds, lambda t: SUM(*t[0]).verify(t[1]))
+		
+		prodder = PRODUCT(str, int)
+		self.assertEqual(SUM(int, SUM(str, int, prodder), prodder, SUM()).args, (int, str, prodder, prodder)) # Flattened, with plain classes deduplicated
+		self.assertEqual(SUM(prodder, float, SUM(prodder, str)).args, (float, str, prodder, prodder)) # Plain classes first
 	
 	@patch(__name__ + ".Ver")
 	def test_PRODUCT(self, notVer):
 		notVer.side_effect = [
-			
-			
 			True, False,
-			True, True, True, True,
+			True, True, True,
 		]
 		
+		summer = SUM(str, int)
+		
 		args = [
 			[[],
 				[]],
@@ -339,6 +579,10 @@ class testSpecifications(testLooperMixin, checkCallsMixin):
 				["hi", 0, 67]],
 			[[int, int, str, float],
 				[1, 5, "hello", 3.5]],
+			[[str, summer],
+				["hi", 3.5]],
+			[[summer, int, str],
+				[0, 5, "hello"]],
 		]
 		
 		expecteds = [
@@ -346,20 +590,23 @@ class testSpecifications(testLooperMixin, checkCallsMixin):
 			False,
 			False,
 			True,
+			False,
+			True,
 		]
 		
 		afters = [
 			lambda: None,
 			lambda: None,
+			lambda: notVer.assert_not_called(), # Only plain types, so 'isinstance' is called directly
+			lambda: notVer.assert_not_called(),
 			lambda: self.checkCalls(notVer,
 				call("hi", str),
-				call(0, str),
+				call(3.5, summer),
 			),
 			lambda: self.checkCalls(notVer,
-				call(1, int),
+				call(0, summer),
 				call(5, int),
 				call("hello", str),
-				call(3.5, float),
 			),
 		]
 		
@@ -393,12 +640,7 @@ class testSpecifications(testLooperMixin, checkCallsMixin):
 			False,
 		]
 		
-		def before2(): notVer.side_effect = setwiseChecker(
-			[	("hi", str),	("there", str),
-			], [	{},		{},
-			], [	True,		True,
-			]
-		)
+		def before2(): notVer.side_effect = setwiseChecker([], [], []) # 'str' is a plain type, so 'isinstance' is called directly
 		
 		def before3(): notVer.side_effect = setwiseChecker(
 			[	("1", summer),	(2, summer),	("3", summer),	(4, summer),
@@ -425,7 +667,7 @@ class testSpecifications(testLooperMixin, checkCallsMixin):
 		afters = [
 			lambda: None,
 			lambda: None,
-			lambda: self.assertTrue(notVer.hasCalls()),
+			lambda: None,
 			lambda: self.assertTrue(notVer.hasCalls()),
 			lambda: self.assertTrue(notVer.hasCalls(1)),
 		]
@@ -475,28 +717,28 @@ class testSpecifications(testLooperMixin, checkCallsMixin):
 		]
 		
 		def before1(): prodder.verify.side_effect = setwiseChecker(
-			[	(["hello", 5],),	(["bye", 3],),
+			[	(("hello", 5),),	(("bye", 3),),
 			], [	{},			{},
 			], [	True,			True,
 			]
 		)
 		
 		def before2(): prodder.verify.side_effect = setwiseChecker(
-			[	([5.5, 0],),	(["chicken", 4],),
+			[	((5.5, 0),),	(("chicken", 4),),
 			], [	{},		{},
 			], [	False,		True,
 			]
 		)
 		
 		def before4(): summer.verify.side_effect = setwiseChecker(
-			[	([4.4, 7],),	([4 + 6j, 6.6],),
+			[	((4.4, 7),),	((4 + 6j, 6.6),),
 			], [	{},		{},
 			], [	True,		True,
 			]
 		)
 		
 		def before5(): summer.verify.side_effect = setwiseChecker(
-			[	(["Hg", 80.0],),	(["Pb", 82 + 0j],),
+			[	(("Hg", 80.0),),	(("Pb", 82 + 0j),),
 			], [	{},			{},
 			], [	True,			False,
 			]
@@ -522,5 +764,110 @@ class testSpecifications(testLooperMixin, checkCallsMixin):
 		
 		self.loopTests(args, expecteds, lambda t: DICT(t[0]).verify(t[1]), befores = befores, afters = afters)
 
+class testFrontend(testLooperMixin):
+	def test_Ver(self):
+		class SUBCLASSED(SUM):
+			pass
+		
+		class REGISTERED():
+			def verify(self, obj): return obj == "registered"
+		
+		VERIFYABLE.register(REGISTERED)
+		
+		args = [
+			[5, int],
+			[5, str],
+			[True, int],
+			[5, (str, int)],
+			[5, SUM(str, int)],
+			[5.0, SUBCLASSED(str, int)],
+			["registered", REGISTERED()],
+			["unregistered", REGISTERED()],
+		]
+		
+		expecteds = [
+			True,
+			False,
+			True,
+			True,
+			True,
+			False,
+			True,
+			False,
+		]
+		
+		self.loopTests(args, expecteds, lambda t: Ver(*t))
+		
+		# Defining specification classes at runtime mustn't keep them alive
+		del args # Holds an instance
+		SUBCLASSED = weakref.ref(SUBCLASSED)
+		gc.collect()
+		self.assertIsNone(SUBCLASSED())
+	
+	def test_Compile(self):
+		class OVERRIDDEN(LIST):
+			def verify(self, objs): return objs == ["overridden"]
+		
+		class NONEMPTY(VERIFYABLE):
+			def verify(self, objs): return len(objs) > 0 and super().verify(objs)
+		class NELIST(LIST, NONEMPTY): pass
+		class NEDICT(DICT, NONEMPTY): pass
+		
+		class INSTANCED:
+			def __init__(self): self.verify = lambda pair: pair[0] == "a"
+		
+		prodder = PRODUCT(str, SUM(int, LIST(float)))
+		spec = LIST(
+			DICT(
+				SUM(
+					PRODUCT(frozenset, int),
+					PRODUCT(str, complex),
+				),
+				length = 1,
+			),
+			minlength = 1,
+			maxlength = 3,
+		)
+		
+		args = [
+			[int, 5],
+			[int, "5"],
+			[(str, int), 5],
+			[SUM(), 5],
+			[PRODUCT(), ()],
+			[prodder, ("a", 5)],
+			[prodder, ["a", [1.5, 2.5]]],
+			[prodder, ("a", [1.5, "2.5"])],
+			[prodder, ("a", 5, 6)],
+			[prodder, {"a", "b"}], # False whichever order the set is iterated in
+			[SET(prodder), {("a", 5), ("b", 6)}],
+			[TUPLE(OVERRIDDEN(int)), (["overridden"], ["overridden"])],
+			[TUPLE(OVERRIDDEN(int)), ([5],)],
+			[DICT(prodder), {"a": 5, "b": [1.5]}],
+			[DICT(prodder), {"a": 5, 6: 7}],
+			[NELIST(int), []],
+			[NELIST(int), [5]],
+			[NELIST(int), ["5"]],
+			[NEDICT(PRODUCT(str, int)), {}],
+			[NEDICT(PRODUCT(str, int)), {"a": 5}],
+			[DICT(Mock(verify = Mock(return_value = True))), {"a": 5}],
+			[DICT(INSTANCED()), {"a": 5}],
+			[DICT(INSTANCED()), {"b": 5}],
+			[spec, [{frozenset(): 5}, {"a": 1j}]],
+			[spec, [{frozenset(): 5}, {"a": 1j, "b": 2j}]],
+			[spec, []],
+			[spec, [{frozenset(): 5}] * 3],
+		]
+		
+		expecteds = [Ver(obj, spec) for [spec, obj] in args]
+		self.assertEqual(expecteds.count(True), 13) # So that both outcomes are tested
+		
+		self.loopTests(args, expecteds, lambda t: Compile(t[0])(t[1]))
+		
+		deep = int
+		for i in range(1000):
+			deep = LIST(deep)
+		self.assertFalse(Compile(deep)([[5]])) # Falls back to 'Ver'
+
 if __name__ == "__main__":
 	unittest.main()
@@ -1,2 +1,2 @@
 from .SD import serers, desers, Ser, Des
-from .V import Ver
+from .V import Ver, Compile